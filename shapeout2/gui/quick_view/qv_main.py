@@ -11,6 +11,19 @@ from ..compute.comp_stats import STAT_METHODS
 from .. import idiom
 from ..widgets import show_wait_cursor
 
+#: scalar features known to dclab (resolved once at import time to
+#: avoid repeated module attribute lookups in loops)
+SCALAR_FEATURE_NAMES = tuple(dclab.dfn.scalar_feature_names)
+
+#: fluorescence trace keys known to dclab
+FLUOR_TRACES = tuple(dclab.dfn.FLUOR_TRACES)
+
+#: 4-connectivity structuring element for `get_mask_contour`
+#: (allocated once instead of on every `binary_erosion` call)
+EROSION_STRUCT = np.array([[0, 1, 0],
+                           [1, 1, 1],
+                           [0, 1, 0]], dtype=bool)
+
 
 class QuickView(QtWidgets.QWidget):
     polygon_filter_created = QtCore.pyqtSignal()
@@ -74,6 +87,15 @@ class QuickView(QtWidgets.QWidget):
         self.tabWidget_event.currentChanged.connect(
             self.on_event_scatter_update)
 
+        # Coalesce plot updates: cascades from the widgets below (or
+        # programmatic state changes) may request a replot several times
+        # in a row; a single-shot zero-interval timer collapses those
+        # requests to one replot per event loop iteration.
+        self._plot_timer = QtCore.QTimer(self)
+        self._plot_timer.setSingleShot(True)
+        self._plot_timer.setInterval(0)
+        self._plot_timer.timeout.connect(self._do_plot)
+
         # value changed signals for plot
         self.signal_widgets = [self.checkBox_downsample,
                                self.spinBox_downsample,
@@ -85,11 +107,14 @@ class QuickView(QtWidgets.QWidget):
                                ]
         for w in self.signal_widgets:
             if hasattr(w, "currentIndexChanged"):
-                w.currentIndexChanged.connect(self.plot)
+                signal = w.currentIndexChanged
             elif hasattr(w, "stateChanged"):
-                w.stateChanged.connect(self.plot)
+                signal = w.stateChanged
             elif hasattr(w, "valueChanged"):
-                w.valueChanged.connect(self.plot)
+                signal = w.valueChanged
+            # invalidate the cached plot state first, then replot
+            signal.connect(self._invalidate_plot_state)
+            signal.connect(self.plot)
         # copy statistics to clipboard
         self.toolButton_stats2clipboard.clicked.connect(
             self.on_stats2clipboard)
@@ -122,16 +147,32 @@ class QuickView(QtWidgets.QWidget):
         self._rtdc_ds = None
         self.slot = None
 
+        # cached (label, feature) rows of the event feature table
+        self._feature_rows = None
+
+        # reusable RGB buffers for `get_event_image` (per image view)
+        self._rgb_scratch = {}
+
+        # features the axis comboboxes were populated with
+        self._feats_applied = None
+
+        # cached "plot" state (see `_get_plot_state`)
+        self._plot_state = None
+
+        # [calculation] metadata from the previous `_do_plot` (stored
+        # to detect e.g. emodulus recipe changes which require a full
+        # event panel re-render)
+        self._calc_state = None
+
+        # fluorescence trace time axis (set in `show_rtdc`)
+        self._flrate = None
+        self._fltime = None
+        self._fltime_end = None
+
+        # state of the trace legend from the previous `show_event`
+        self._legend_state = None
+
     def __getstate__(self):
-        plot = {
-            "downsampling": self.checkBox_downsample.isChecked(),
-            "downsampling value": self.spinBox_downsample.value(),
-            "axis x": self.comboBox_x.currentData(),
-            "axis y": self.comboBox_y.currentData(),
-            "scale x": self.comboBox_xscale.currentData(),
-            "scale y": self.comboBox_yscale.currentData(),
-            "isoelastics": self.checkBox_isoelastics.isChecked(),
-        }
         event = {
             "index": self.spinBox_event.value(),
             "image auto contrast": self.checkBox_image_contrast.isChecked(),
@@ -142,7 +183,8 @@ class QuickView(QtWidgets.QWidget):
             "trace zoom": self.checkBox_trace_zoom.isChecked(),
         }
         state = {
-            "plot": plot,
+            # copy, because callers modify the plot state in-place
+            "plot": dict(self._get_plot_state()),
             "event": event,
         }
         return state
@@ -169,6 +211,8 @@ class QuickView(QtWidgets.QWidget):
         self.checkBox_isoelastics.setChecked(plot["isoelastics"])
         for tb in self.signal_widgets:
             tb.blockSignals(False)
+        # the widgets above were updated with signals blocked
+        self._invalidate_plot_state()
         if "event" in state:
             event = state["event"]
             self.checkBox_image_contrast.setChecked(
@@ -179,6 +223,30 @@ class QuickView(QtWidgets.QWidget):
             self.checkBox_trace_raw.setChecked(event["trace raw"])
             self.checkBox_trace_legend.setChecked(event["trace legend"])
 
+    def _get_plot_state(self):
+        """Return the "plot" part of the current UI state
+
+        Reading out the plot controls means one Qt property access
+        per widget. Since those controls only change when one of the
+        `signal_widgets` emits a signal (or during `__setstate__`),
+        the dict is cached and rebuilt on-demand after invalidation.
+        """
+        if self._plot_state is None:
+            self._plot_state = {
+                "downsampling": self.checkBox_downsample.isChecked(),
+                "downsampling value": self.spinBox_downsample.value(),
+                "axis x": self.comboBox_x.currentData(),
+                "axis y": self.comboBox_y.currentData(),
+                "scale x": self.comboBox_xscale.currentData(),
+                "scale y": self.comboBox_yscale.currentData(),
+                "isoelastics": self.checkBox_isoelastics.isChecked(),
+            }
+        return self._plot_state
+
+    def _invalidate_plot_state(self):
+        """Discard the cached plot state (see `_get_plot_state`)"""
+        self._plot_state = None
+
     def _check_file_open(self, rtdc_ds):
         """Check whether a dataset is still open"""
         if isinstance(rtdc_ds, dclab.rtdc_dataset.RTDC_HDF5):
@@ -222,45 +290,62 @@ class QuickView(QtWidgets.QWidget):
     def rtdc_ds(self, rtdc_ds):
         self._rtdc_ds = rtdc_ds
 
-    def get_event_image(self, ds, event):
-        state = self.__getstate__()
+    def get_event_image(self, ds, event, view="event"):
+        """Return the event image (RGB) and the image view parameters
+
+        `view` identifies the image view the data is intended for
+        ("event" or "poly"); the RGB scratch buffers are kept separate
+        per view, because the image items keep a reference to the
+        displayed array.
+        """
         imkw = self.imkw.copy()
         cellimg = ds["image"][event]
         # automatic contrast
-        if state["event"]["image auto contrast"]:
+        if self.checkBox_image_contrast.isChecked():
             vmin, vmax = cellimg.min(), cellimg.max()
             cellimg = (cellimg - vmin) / (vmax - vmin) * 255
-        # convert to RGB
-        cellimg = cellimg.reshape(
-            cellimg.shape[0], cellimg.shape[1], 1)
-        cellimg = np.repeat(cellimg, 3, axis=2)
         # convert to int
         cellimg = np.require(cellimg, np.uint8, 'C')
+        # Convert to RGB using a broadcast view. This does not copy
+        # any data; a writable copy is only created when the contour
+        # is actually drawn into the image below.
+        cellimg = np.broadcast_to(cellimg[:, :, None], cellimg.shape + (3,))
 
         # Only load contour data if there is an image column.
         # We don't know how big the images should be so we
         # might run into trouble displaying random contours.
         if "mask" in ds and len(ds["mask"]) > event:
             mask = ds["mask"][event]
-            if state["event"]["image contour"]:
+            if self.checkBox_image_contour.isChecked():
+                # materialize the RGB image in a reusable scratch
+                # buffer (we have to write to it and the image shape
+                # is constant within a dataset)
+                scratch = self._rgb_scratch.get(view)
+                if scratch is None or scratch.shape != cellimg.shape:
+                    scratch = np.empty(cellimg.shape, dtype=np.uint8)
+                    self._rgb_scratch[view] = scratch
+                np.copyto(scratch, cellimg)
+                cellimg = scratch
                 # compute contour image from mask
-                cont = mask ^ binary_erosion(mask)
+                cont = get_mask_contour(mask)
                 # set red contour pixel values in original image
-                cellimg[cont, 0] = int(255*.7)
-                cellimg[cont, 1] = 0
-                cellimg[cont, 2] = 0
-            if state["event"]["image zoom"]:
-                xv, yv = np.where(mask)
-                idminx = xv.min() - 5
-                idminy = yv.min() - 5
-                idmaxx = xv.max() + 5
-                idmaxy = yv.max() + 5
-                idminx = idminx if idminx >= 0 else 0
-                idminy = idminy if idminy >= 0 else 0
-                shx, shy = mask.shape
-                idmaxx = idmaxx if idmaxx < shx else shx
-                idmaxy = idmaxy if idmaxy < shy else shy
-                cellimg = cellimg[idminx:idmaxx, idminy:idmaxy]
+                cellimg[cont] = (int(255*.7), 0, 0)
+            if self.checkBox_image_zoom.isChecked():
+                # Compute the bounding box from two 1D reductions
+                # (this does not allocate index arrays like np.where).
+                rows = np.any(mask, axis=1)
+                cols = np.any(mask, axis=0)
+                if np.any(rows):
+                    shx, shy = mask.shape
+                    idminx = int(np.argmax(rows)) - 5
+                    idminy = int(np.argmax(cols)) - 5
+                    idmaxx = shx - 1 - int(np.argmax(rows[::-1])) + 5
+                    idmaxy = shy - 1 - int(np.argmax(cols[::-1])) + 5
+                    idminx = idminx if idminx >= 0 else 0
+                    idminy = idminy if idminy >= 0 else 0
+                    idmaxx = idmaxx if idmaxx < shx else shx
+                    idmaxy = idmaxy if idmaxy < shy else shy
+                    cellimg = cellimg[idminx:idmaxx, idminy:idmaxy]
         return cellimg, imkw
 
     def get_statistics(self):
@@ -274,6 +359,7 @@ class QuickView(QtWidgets.QWidget):
         else:
             return None, None
 
+    @QtCore.pyqtSlot(object, object)
     def on_event_scatter_clicked(self, plot, point):
         """User clicked on scatter plot
 
@@ -290,38 +376,41 @@ class QuickView(QtWidgets.QWidget):
             # emulate mouse toggle
             self.toolButton_event.setChecked(True)
             self.toolButton_event.toggled.emit(True)
-        if self.widget_scatter.events_plotted is not None:
-            # plotted events
-            plotted = self.widget_scatter.events_plotted
-            # get corrected index
-            ds_idx = np.where(plotted)[0][point.index()]
+        if self.widget_scatter.events_plotted_idx is not None:
+            # get corrected index (dataset index of the plotted point)
+            ds_idx = int(
+                self.widget_scatter.events_plotted_idx[point.index()])
             self.show_event(ds_idx)
 
+    @QtCore.pyqtSlot(QtCore.QPointF)
     def on_event_scatter_hover(self, pos):
         """Update the image view in the polygon widget """
         if self.rtdc_ds is not None and self.toolButton_poly.isChecked():
-            # plotted events
-            plotted = self.widget_scatter.events_plotted
             spos = self.widget_scatter.scatter.mapFromView(pos)
             point = self.widget_scatter.scatter.pointAt(spos)
-            # get corrected index
-            event = np.where(plotted)[0][point.index()]
+            # get corrected index (dataset index of the plotted point)
+            event = int(
+                self.widget_scatter.events_plotted_idx[point.index()])
             if "image" in self.rtdc_ds:
-                cellimg, imkw = self.get_event_image(self.rtdc_ds, event)
+                cellimg, imkw = self.get_event_image(self.rtdc_ds, event,
+                                                     view="poly")
                 self.imageView_image_poly.setImage(cellimg, **imkw)
                 self.imageView_image_poly.show()
             else:
                 self.imageView_image_poly.hide()
 
+    @QtCore.pyqtSlot(int)
     def on_event_scatter_spin(self, event):
         """Sping control for event selection changed"""
         self.show_event(event - 1)
 
+    @QtCore.pyqtSlot()
     def on_event_scatter_update(self):
         """Just update the event shown"""
         event = self.spinBox_event.value()
         self.show_event(event - 1)
 
+    @QtCore.pyqtSlot()
     def on_poly_create(self):
         """User wants to create a polygon filter"""
         self.pushButton_poly_create.setEnabled(False)
@@ -345,6 +434,7 @@ class QuickView(QtWidgets.QWidget):
         mdiwin.update()
         self.update()
 
+    @QtCore.pyqtSlot()
     def on_poly_done(self):
         """User is done creating or modifying a polygon filter"""
         self.pushButton_poly_create.setEnabled(True)
@@ -381,6 +471,7 @@ class QuickView(QtWidgets.QWidget):
         elif mode == "modify":
             self.polygon_filter_modified.emit()
 
+    @QtCore.pyqtSlot()
     def on_poly_modify(self):
         """User wants to modify a polygon filter"""
         self.pushButton_poly_create.setEnabled(False)
@@ -400,10 +491,13 @@ class QuickView(QtWidgets.QWidget):
         state["plot"]["axis x"] = pf.axes[0]
         state["plot"]["axis y"] = pf.axes[1]
         self.__setstate__(state)
-        self.plot()
+        # plot synchronously (the polygon points below must be set
+        # with the correct axis scales in place)
+        self._do_plot()
         # add ROI
         self.widget_scatter.activate_poly_mode(pf.points)
 
+    @QtCore.pyqtSlot()
     def on_stats2clipboard(self):
         """Copy the statistics as tsv data to the clipboard"""
         h, v = self.get_statistics()
@@ -418,6 +512,20 @@ class QuickView(QtWidgets.QWidget):
     @QtCore.pyqtSlot()
     def on_tool(self, collapse=False):
         """Show and hide tools when the user selected a tool button"""
+        self.update_tool(collapse=collapse, sender=self.sender())
+
+    def update_tool(self, collapse=False, sender=None, resize_only=False):
+        """Apply tool button visibility (see `on_tool`)
+
+        This is split-off from `on_tool` so that it can be called
+        from deferred contexts (`_do_plot`) without the event
+        processing of the `show_wait_cursor` decorator.
+
+        With `resize_only=True`, the event panel is not re-rendered
+        (only the selection point in the scatter plot is updated);
+        this is used by `_do_plot`, where a full `show_event` would
+        be redundant.
+        """
         toblock = [self.toolButton_event,
                    self.toolButton_poly,
                    self.toolButton_settings,
@@ -428,7 +536,6 @@ class QuickView(QtWidgets.QWidget):
         show_event = False
         show_poly = False
         show_settings = False
-        sender = self.sender()
         if sender == self.toolButton_event:
             show_event = self.toolButton_event.isChecked()
         elif sender == self.toolButton_poly:
@@ -456,8 +563,14 @@ class QuickView(QtWidgets.QWidget):
         self.widget_settings.setVisible(show_settings)
 
         if show_event:
-            # update event plot (maybe axes changed)
-            self.on_event_scatter_update()
+            if resize_only:
+                # The event data itself is unaffected by a replot;
+                # only the selection point depends on the plot axes.
+                self.widget_scatter.setSelection(
+                    self.spinBox_event.value() - 1)
+            else:
+                # update event plot (maybe axes changed)
+                self.on_event_scatter_update()
 
         for b in toblock:
             b.blockSignals(False)
@@ -475,12 +588,19 @@ class QuickView(QtWidgets.QWidget):
         mdiwin.adjustSize()
         mdiwin.update()
 
-    @show_wait_cursor
     @QtCore.pyqtSlot()
     def plot(self):
+        """Request an update of the plot (coalesced via `self._plot_timer`)"""
+        self._plot_timer.start()
+
+    # Note that this method is not decorated with `show_wait_cursor`:
+    # it runs deferred from the event loop (`self._plot_timer`) and
+    # must not pump events itself.
+    @QtCore.pyqtSlot()
+    def _do_plot(self):
         """Update the plot using the current state of the UI"""
         if self.rtdc_ds is not None:
-            plot = self.__getstate__()["plot"]
+            plot = self._get_plot_state()
             downsample = plot["downsampling"] * plot["downsampling value"]
 
             self.widget_scatter.plot_data(rtdc_ds=self.rtdc_ds,
@@ -491,9 +611,17 @@ class QuickView(QtWidgets.QWidget):
                                           xscale=plot["scale x"],
                                           yscale=plot["scale y"],
                                           isoelastics=plot["isoelastics"])
+            # The event panel shows calculation-dependent values
+            # (e.g. emodulus); when the [calculation] metadata changed
+            # since the previous plot, the panel must be re-rendered.
+            # Otherwise, only the selection point has to be updated.
+            cfg = self.rtdc_ds.config
+            calc_state = dict(
+                cfg["calculation"]) if "calculation" in cfg else None
             # make sure the correct plot items are visible
             # (e.g. scatter select)
-            self.on_tool()
+            self.update_tool(resize_only=calc_state == self._calc_state)
+            self._calc_state = calc_state
             # update polygon filter axis names
             self.label_poly_x.setText(
                 dclab.dfn.get_feature_label(plot["axis x"]))
@@ -526,9 +654,14 @@ class QuickView(QtWidgets.QWidget):
 
         # Update selection point in scatter plot
         self.widget_scatter.setSelection(event)
+        if self.widget_event.isHidden():
+            # The event panel is collapsed; don't render the image,
+            # traces or feature table into hidden widgets. When the
+            # panel is shown again, `update_tool` performs a full
+            # refresh via `on_event_scatter_update`.
+            return
         if self.tabWidget_event.currentIndex() == 0:
             # update image
-            state = self.__getstate__()
             if "image" in ds:
                 cellimg, imkw = self.get_event_image(ds, event)
                 self.imageView_image.setImage(cellimg, **imkw)
@@ -536,34 +669,43 @@ class QuickView(QtWidgets.QWidget):
             else:
                 self.groupBox_image.hide()
             if "trace" in ds:
-                # remove legend items
-                for item in reversed(self.legend_trace.items):
-                    self.legend_trace.removeItem(item[1].text)
-                self.legend_trace.setVisible(state["event"]["trace legend"])
-                # get slot from identifier
-                # time axis
-                flsamples = ds.config["fluorescence"]["samples per event"]
-                flrate = ds.config["fluorescence"]["sample rate"]
-                fltime = np.arange(flsamples) / flrate * 1e6
-                # temporal range (min, max, fl-peak-maximum)
-                range_t = [fltime[0], fltime[-1], 0]
-                # fluorescence intensity
-                range_fl = [0, 0]
-                for key in dclab.dfn.FLUOR_TRACES:
-                    if key.count("raw") and not state["event"]["trace raw"]:
-                        # hide raw trace data if user decided so
-                        show = False
-                    else:
-                        show = True
-                    flid = key.split("_")[0]
-                    if (key in ds["trace"] and show):
-                        # show the trace information
-                        tracey = ds["trace"][key][event]  # trace data
-                        range_fl[0] = min(range_fl[0], tracey.min())
-                        range_fl[1] = max(range_fl[1], tracey.max())
-                        self.trace_plots[key].setData(fltime, tracey)
-                        self.trace_plots[key].show()
-                        if state["event"]["trace zoom"]:
+                trace_raw = self.checkBox_trace_raw.isChecked()
+                trace_zoom = self.checkBox_trace_zoom.isChecked()
+                # Tearing down and rebuilding the legend triggers
+                # QGraphics layout work; only do it when the shown
+                # traces (or their user-defined names) changed.
+                shown_traces = tuple(
+                    key for key in FLUOR_TRACES
+                    if key in ds["trace"]
+                    and (trace_raw or "raw" not in key))
+                legend_state = (shown_traces,
+                                self.checkBox_trace_legend.isChecked(),
+                                tuple(sorted(self.slot.fl_name_dict.items())))
+                update_legend = legend_state != self._legend_state
+                # Suppress intermediate repaints: the legend
+                # changes, setData and range updates below would
+                # each schedule their own; one repaint at the end
+                # is enough.
+                self.graphicsView_trace.setUpdatesEnabled(False)
+                try:
+                    if update_legend:
+                        self._legend_state = legend_state
+                        # remove legend items
+                        for item in reversed(self.legend_trace.items):
+                            self.legend_trace.removeItem(item[1].text)
+                        self.legend_trace.setVisible(legend_state[1])
+                    # get slot from identifier
+                    # time axis (precomputed in `show_rtdc`)
+                    fltime = self._fltime
+                    # temporal range (min, max, fl-peak-maximum)
+                    range_t = [0, self._fltime_end, 0]
+                    trace_slice = slice(None)
+                    if trace_zoom:
+                        # Determine the zoom window from the scalar peak
+                        # features first, so that below only the samples
+                        # that are actually shown have to be processed.
+                        for flid in sorted({k.split("_")[0]
+                                            for k in shown_traces}):
                             flpos = ds["{}_pos".format(flid)][event]
                             flwidth = ds["{}_width".format(flid)][event]
                             flmax = ds["{}_max".format(flid)][event]
@@ -572,25 +714,69 @@ class QuickView(QtWidgets.QWidget):
                                 range_t[0] = flpos - 1.5 * flwidth
                                 range_t[1] = flpos + 1.5 * flwidth
                                 range_t[2] = flmax
-                        # set legend name
-                        ln = "{} {}".format(self.slot.fl_name_dict[
-                            "FL-{}".format(key[2])], key[4:])
-                        self.legend_trace.addItem(self.trace_plots[key], ln)
-                        self.legend_trace.update()
-                    else:
-                        self.trace_plots[key].hide()
-                self.graphicsView_trace.setXRange(*range_t[:2], padding=0)
-                if range_fl[0] != range_fl[1]:
-                    self.graphicsView_trace.setYRange(*range_fl, padding=.01)
-                self.graphicsView_trace.setLimits(xMin=0, xMax=fltime[-1])
+                        if range_t[2] > 0:
+                            # convert the time window to sample indices
+                            i1 = min(fltime.size,
+                                     int(np.ceil(range_t[1] * 1e-6
+                                                 * self._flrate)) + 1)
+                            # clamp from both sides so that the slice is
+                            # never empty (fl?_pos may lie outside the
+                            # trace window for malformed data)
+                            i0 = min(max(0, int(range_t[0] * 1e-6
+                                                * self._flrate)),
+                                     i1 - 1)
+                            trace_slice = slice(i0, i1)
+                            fltime = fltime[trace_slice]
+                    # fluorescence intensity (per-trace extrema are
+                    # collected in the loop and reduced once below;
+                    # seeded with 0 to preserve the [0, 0] default)
+                    range_fl_min = [0]
+                    range_fl_max = [0]
+                    # pixel width of the trace view (for M4 downsampling)
+                    npix = self.graphicsView_trace.width()
+                    for key in FLUOR_TRACES:
+                        if key in shown_traces:
+                            # show the trace information
+                            tracey = ds["trace"][key][event][trace_slice]
+                            range_fl_min.append(tracey.min())
+                            range_fl_max.append(tracey.max())
+                            self.trace_plots[key].setData(
+                                *downsample_m4(fltime, tracey, npix))
+                            self.trace_plots[key].show()
+                            if update_legend:
+                                # set legend name
+                                ln = "{} {}".format(self.slot.fl_name_dict[
+                                    "FL-{}".format(key[2])], key[4:])
+                                self.legend_trace.addItem(
+                                    self.trace_plots[key], ln)
+                                self.legend_trace.update()
+                        else:
+                            self.trace_plots[key].hide()
+                    self.graphicsView_trace.setXRange(*range_t[:2], padding=0)
+                    range_fl = [min(range_fl_min), max(range_fl_max)]
+                    if range_fl[0] != range_fl[1]:
+                        self.graphicsView_trace.setYRange(*range_fl,
+                                                          padding=.01)
+                    self.graphicsView_trace.setLimits(
+                        xMin=0, xMax=self._fltime_end)
+                finally:
+                    self.graphicsView_trace.setUpdatesEnabled(True)
                 self.groupBox_trace.show()
             else:
                 self.groupBox_trace.hide()
         else:
             # only use computed features (speed)
             fcands = ds.features_loaded
-            feats = [f for f in fcands if f in ds.features_scalar]
-            lf = sorted([(dclab.dfn.get_feature_label(f), f) for f in feats])
+            if self._feature_rows is None or self._feature_rows[0] != fcands:
+                # Only build (and sort) the feature table rows when the
+                # set of loaded features changed; otherwise an event
+                # change boils down to updating the value column.
+                feats_scalar = set(ds.features_scalar)
+                feats = [f for f in fcands if f in feats_scalar]
+                lf = sorted(
+                    [(dclab.dfn.get_feature_label(f), f) for f in feats])
+                self._feature_rows = (fcands, lf)
+            lf = self._feature_rows[1]
             keys = []
             vals = []
             for lii, fii in lf:
@@ -606,7 +792,32 @@ class QuickView(QtWidgets.QWidget):
         """Display an RT-DC measurement given by `path` and `filters`"""
         # Create a hierarchy child so that the user can browse
         # comfortably through the data without seeing hidden events.
-        self.rtdc_ds = dclab.new_dataset(rtdc_ds)
+        # If the same dataset is shown again (e.g. after a filter
+        # change), reuse the existing child; `apply_filter` pulls in
+        # any upstream changes.
+        if (self._rtdc_ds is not None
+                and self._rtdc_ds.hparent is rtdc_ds
+                and self._check_file_open(self._rtdc_ds)):
+            self.rtdc_ds.apply_filter()
+        else:
+            self.rtdc_ds = dclab.new_dataset(rtdc_ds)
+        # feature table rows are only valid per-dataset
+        self._feature_rows = None
+        # force a trace legend rebuild for the new dataset
+        self._legend_state = None
+        # The trace time axis only depends on the dataset configuration,
+        # so it is computed once here instead of on every event change.
+        if "fluorescence" in self.rtdc_ds.config:
+            flsamples = self.rtdc_ds.config["fluorescence"][
+                "samples per event"]
+            flrate = self.rtdc_ds.config["fluorescence"]["sample rate"]
+            self._flrate = flrate
+            self._fltime = np.arange(flsamples) / flrate * 1e6
+            self._fltime_end = float(self._fltime[-1])
+        else:
+            self._flrate = None
+            self._fltime = None
+            self._fltime_end = None
         event_count = self.rtdc_ds.config["experiment"]["event count"]
         if event_count == 0:
             self.widget_scatter.hide()
@@ -634,14 +845,15 @@ class QuickView(QtWidgets.QWidget):
             plot["axis y"] = "deform"
         # check whether axes exist in ds and change them to defaults
         # if necessary
-        ds_features = self.rtdc_ds.features_scalar
+        # (a set, because it is only used for membership checks)
+        ds_features = set(self.rtdc_ds.features_scalar)
         if plot["axis x"] not in ds_features:
-            for feat in dclab.dfn.scalar_feature_names:
+            for feat in SCALAR_FEATURE_NAMES:
                 if feat in ds_features:
                     plot["axis x"] = feat
                     break
         if plot["axis y"] not in ds_features:
-            for feat in dclab.dfn.scalar_feature_names:
+            for feat in SCALAR_FEATURE_NAMES:
                 if feat in ds_features:
                     plot["axis y"] = feat
                     if feat != plot["axis y"]:
@@ -657,8 +869,9 @@ class QuickView(QtWidgets.QWidget):
 
         # set quick view state
         self.__setstate__(state)
-        # scatter plot
-        self.plot()
+        # scatter plot (synchronously; `show_event` below needs the
+        # scatter data to be in place)
+        self._do_plot()
         # select first event in event viewer (also updates selection point)
         self.show_event(0)
         # this only updates the size of the tools (because there is no
@@ -678,6 +891,12 @@ class QuickView(QtWidgets.QWidget):
         if self.rtdc_ds is not None:
             # axes combobox choices
             ds_feats = self.rtdc_ds.features_scalar
+            new_feats = frozenset(ds_feats)
+            if new_feats == self._feats_applied:
+                # the comboboxes are already populated with these
+                # features; don't rebuild them
+                return
+            self._feats_applied = new_feats
             ds_labels = [dclab.dfn.get_feature_label(f) for f in ds_feats]
             ds_fl = sorted(zip(ds_labels, ds_feats))
             for cb in [self.comboBox_x, self.comboBox_y]:
@@ -693,6 +912,8 @@ class QuickView(QtWidgets.QWidget):
                 if idcur >= 0:
                     cb.setCurrentIndex(idcur)
                 cb.blockSignals(blocked)
+            # the comboboxes were repopulated with signals blocked
+            self._invalidate_plot_state()
 
     def update_polygon_panel(self):
         """Update polygon filter combobox etc."""
@@ -708,3 +929,55 @@ class QuickView(QtWidgets.QWidget):
         else:
             self.comboBox_poly.setEnabled(False)
         self.groupBox_poly.setEnabled(False)
+
+
+def downsample_m4(x, y, npix):
+    """Downsample a line plot to at most four points per pixel column
+
+    For each of the `npix` bins, the first, minimum, maximum and last
+    sample are kept ("M4" aggregation). This preserves the rendered
+    line shape while bounding the number of line segments handed to
+    pyqtgraph by the plot width in pixels.
+    """
+    num = len(y)
+    if npix < 1 or num <= 4 * npix:
+        # nothing to gain
+        return x, y
+    size = num // npix  # samples per bin
+    cut = size * npix
+    binned = y[:cut].reshape(npix, size)
+    offsets = np.arange(npix) * size
+    idx = np.empty((npix, 4), dtype=np.intp)
+    idx[:, 0] = offsets
+    idx[:, 1] = offsets + binned.argmin(axis=1)
+    idx[:, 2] = offsets + binned.argmax(axis=1)
+    idx[:, 3] = offsets + size - 1
+    # keep the original sample order within each bin
+    idx.sort(axis=1)
+    idx = idx.ravel()
+    if cut != num:
+        # keep the remainder samples as they are
+        idx = np.concatenate((idx, np.arange(cut, num)))
+    return x[idx], y[idx]
+
+
+def get_mask_contour(mask):
+    """Compute the contour (boolean array) of a 2D boolean mask
+
+    This is a vectorized version of what `scipy.ndimage.binary_erosion`
+    would give us for the 4-neighborhood (shift-and-AND passes instead
+    of a generic n-D filter), which is noticeably faster for the
+    per-event contour overlay.
+    """
+    if mask.size < 64:
+        # not worth the effort (also avoids zero-size edge cases);
+        # `border_value=1` keeps pixels at the image border out of the
+        # contour, consistent with the vectorized code path below
+        return mask & ~binary_erosion(mask, structure=EROSION_STRUCT,
+                                      border_value=1)
+    eroded = mask.copy()
+    eroded[1:, :] &= mask[:-1, :]
+    eroded[:-1, :] &= mask[1:, :]
+    eroded[:, 1:] &= mask[:, :-1]
+    eroded[:, :-1] &= mask[:, 1:]
+    return mask & ~eroded
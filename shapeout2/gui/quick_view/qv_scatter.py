@@ -30,6 +30,9 @@ class QuickViewScatterWidget(SimplePlotWidget):
         #: Boolean array identifying the plotted events w.r.t. the full
         #: dataset
         self.events_plotted = None
+        #: Dataset indices of the plotted events (maps the scatter point
+        #: index to the event index in the full dataset)
+        self.events_plotted_idx = None
         #: Unfiltered and not-downsampled x component of current scatter plot
         self.data_x = None
         #: Unfiltered and not-downsampled y component of current scatter plot
@@ -96,6 +99,9 @@ class QuickViewScatterWidget(SimplePlotWidget):
             xscale=self.xscale,
             yscale=self.yscale)
         self.events_plotted = idx
+        # computed once per render so that point lookups (click/hover)
+        # do not have to materialize the index array each time
+        self.events_plotted_idx = np.flatnonzero(idx)
         #: unfiltered x data
         self.data_x = self.rtdc_ds[self.xax]
         #: unfiltered y data
@@ -17,6 +17,8 @@ class KeyValueTableWidget(QtWidgets.QTableWidget):
         self.verticalHeader().hide()
         self.setAlternatingRowColors(True)
         self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        #: keys from the previous call to `set_key_vals`
+        self._set_keys = []
         # For some reason this does not work here.
         # self.setColumnCount(2)
         # header = self.horizontalHeader()
@@ -29,44 +31,55 @@ class KeyValueTableWidget(QtWidgets.QTableWidget):
         # disable updates
         self.setUpdatesEnabled(False)
         # rows'n'cols
+        if self.columnCount() != 2:
+            self.setColumnCount(2)
+            # spacing (does not work in __init__ when there are
+            # no columns yet and only has to be set up once)
+            header = self.horizontalHeader()
+            header.setSectionResizeMode(
+                0, QtWidgets.QHeaderView.ResizeToContents)
+            header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
         self.setRowCount(len(keys))
-        self.setColumnCount(2)
+        # The keys (and thus the name column and the tooltips) normally
+        # only change when a different dataset is shown; skip them for
+        # value-only updates.
+        keys = list(keys)
+        keys_changed = keys != self._set_keys
+        self._set_keys = keys
+        # determine invalid (nan/inf) values in one vectorized pass
+        # instead of calling np.isnan/np.isinf per row
+        finite = np.isfinite(np.asarray(vals, dtype=np.float64))
         # populate
         for ii, (hi, vi) in enumerate(zip(keys, vals)):
-            # name
-            if len(hi) < max_key_len:
-                name_vis = hi
-            else:
-                name_vis = hi[:max_key_len-3] + "..."
-            # pad with spaces (b/c css padding caused overlap)
-            name_vis = " " + name_vis + " "
             label_name = self.item(ii, 0)
             if label_name is None:
-                label_name = QtWidgets.QTableWidgetItem(name_vis)
+                # create the (reused) items for this row
+                label_name = QtWidgets.QTableWidgetItem()
                 label_name.setFlags(QtCore.Qt.ItemIsEnabled)
                 self.setItem(ii, 0, label_name)
+                label_value = QtWidgets.QTableWidgetItem()
+                label_value.setFlags(QtCore.Qt.ItemIsEnabled)
+                self.setItem(ii, 1, label_value)
+                new_row = True
             else:
-                if label_name.text() != name_vis:
-                    label_name.setText(name_vis)
-            label_name.setToolTip(hi)
+                label_value = self.item(ii, 1)
+                new_row = False
+            if keys_changed or new_row:
+                # name
+                if len(hi) < max_key_len:
+                    name_vis = hi
+                else:
+                    name_vis = hi[:max_key_len-3] + "..."
+                # pad with spaces (b/c css padding caused overlap)
+                name_vis = " " + name_vis + " "
+                label_name.setText(name_vis)
+                label_name.setToolTip(hi)
+                label_value.setToolTip(hi)
             # value
-            if np.isnan(vi) or np.isinf(vi):
-                fmt = "{}"
-            else:
+            if finite[ii]:
                 fmt = "{:.7g}"
-            value_vis = fmt.format(vi)
-            label_value = self.item(ii, 1)
-            if label_value is None:
-                label_value = QtWidgets.QTableWidgetItem(value_vis)
-                label_value.setFlags(QtCore.Qt.ItemIsEnabled)
-                self.setItem(ii, 1, label_value)
             else:
-                label_value.setText(value_vis)
-            label_value.setToolTip(hi)
-        # spacing (did not work in __init__)
-        header = self.horizontalHeader()
-        header.setSectionResizeMode(
-            0, QtWidgets.QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
+                fmt = "{}"
+            label_value.setText(fmt.format(vi))
         # enable updates again
         self.setUpdatesEnabled(True)
@@ -1,4 +1,5 @@
 import copy
+import functools
 import warnings
 
 import dclab
@@ -10,6 +11,16 @@ from .filter_ray import FilterRay
 from .plot import Plot
 
 
+@functools.lru_cache(maxsize=None)
+def get_feature_label(feat):
+    """Cached wrapper around :func:`dclab.dfn.get_feature_label`
+
+    The feature labels are hard-coded in dclab and do not change
+    within a process.
+    """
+    return dclab.dfn.get_feature_label(feat)
+
+
 class EmptyDatasetWarning(UserWarning):
     pass
 
@@ -32,12 +43,18 @@ class Pipeline(object):
             return
         self._old_state = state
         self.reset()
-        for filt_state in state["filters"]:
-            self.add_filter(filt_state)
-        for plot_state in state["plots"]:
-            self.add_plot(plot_state)
-        for slot_state in state["slots"]:
-            self.add_slot(slot=slot_state)
+        # The element states are assigned wholesale below; skip the
+        # per-element initialization that `add_*` would perform.
+        self._batch_restore = True
+        try:
+            for filt_state in state["filters"]:
+                self.add_filter(filt_state)
+            for plot_state in state["plots"]:
+                self.add_plot(plot_state)
+            for slot_state in state["slots"]:
+                self.add_slot(slot=slot_state)
+        finally:
+            self._batch_restore = False
         # set element states at the end
         self.element_states = state["elements"]
 
@@ -59,7 +76,8 @@ class Pipeline(object):
 
     @property
     def filter_ids(self):
-        return [filt.identifier for filt in self.filters]
+        """List of filter identifiers (updated in mutators - do not modify)"""
+        return self._filter_ids
 
     @property
     def filters_used(self):
@@ -67,11 +85,13 @@ class Pipeline(object):
 
     @property
     def plot_ids(self):
-        return [plot.identifier for plot in self.plots]
+        """List of plot identifiers (updated in mutators - do not modify)"""
+        return self._plot_ids
 
     @property
     def slot_ids(self):
-        return [slot.identifier for slot in self.slots]
+        """List of slot identifiers (updated in mutators - do not modify)"""
+        return self._slot_ids
 
     @property
     def slots_used(self):
@@ -124,8 +144,10 @@ class Pipeline(object):
             filt.__setstate__(state)
         self.filters.insert(index, filt)
         filt_id = filt.identifier
-        for slot_id in self.slot_ids:
-            self.element_states[slot_id][filt_id] = False
+        self._filter_ids.insert(index, filt_id)
+        if not self._batch_restore:
+            for slot_states in self.element_states.values():
+                slot_states[filt_id] = False
         return filt_id
 
     def add_plot(self, plot=None, index=None):
@@ -160,8 +182,10 @@ class Pipeline(object):
 
         self.plots.insert(index, plot)
         plot_id = plot.identifier
-        for slot_id in self.slot_ids:
-            self.element_states[slot_id][plot_id] = False
+        self._plot_ids.insert(index, plot_id)
+        if not self._batch_restore:
+            for slot_states in self.element_states.values():
+                slot_states[plot_id] = False
 
         return plot.identifier
 
@@ -205,12 +229,14 @@ class Pipeline(object):
             slot.__setstate__(state)
 
         self.slots.insert(index, slot)
+        self._rebuild_slot_index()
         slot_id = slot.identifier
-        self.element_states[slot_id] = {}
-        for filt_id in self.filter_ids:
-            self.element_states[slot_id][filt_id] = False
-        for plot_id in self.plot_ids:
-            self.element_states[slot_id][plot_id] = False
+        if not self._batch_restore:
+            self.element_states[slot_id] = {}
+            for filt_id in self.filter_ids:
+                self.element_states[slot_id][filt_id] = False
+            for plot_id in self.plot_ids:
+                self.element_states[slot_id][plot_id] = False
         return slot.identifier
 
     def apply_filter_ray(self, rtdc_ds, slot_id):
@@ -227,7 +253,7 @@ class Pipeline(object):
             Identifier of the slot from which the filters are taken
         """
         # make sure the current ray is built correctly
-        self.get_dataset(self.slot_ids.index(slot_id), apply_filter=False)
+        self.get_dataset(self._slot_index[slot_id], apply_filter=False)
         # get the ray
         ray = self.get_ray(slot_id)
         ds = ray.get_final_child(rtdc_ds)
@@ -262,12 +288,12 @@ class Pipeline(object):
             if filt_index < 0:
                 filt_index = len(self.filters) - 1
             slot_id = slot.identifier
-            # the filters used
-            filters = []
-            for filt_id in self.filter_ids[:filt_index+1]:
-                if (self.is_element_active(slot_id, filt_id)
-                        and filt_id in self.filters_used):
-                    filters.append(self.get_filter(filt_id))
+            # the filters used (test `filter_used` on the instances
+            # directly instead of resolving identifiers through the
+            # `filters_used` list)
+            fstates = self.element_states[slot_id]
+            filters = [filt for filt in self.filters[:filt_index+1]
+                       if filt.filter_used and fstates[filt.identifier]]
             # filter ray magic
             ray = self.get_ray(slot.identifier)
             ds = ray.get_dataset(filters, apply_filter=apply_filter)
@@ -313,11 +339,12 @@ class Pipeline(object):
             features = set()
         else:
             features = None
+        used_slots = set(self.slots_used)
         for slot_index in range(self.num_slots):
             slot_id = self.slot_ids[slot_index]
             if (plot_id is None
                 or (self.element_states[slot_id][plot_id]
-                    and slot_id in self.slots_used)):
+                    and slot_id in used_slots)):
                 ds = self.get_dataset(slot_index=slot_index, filt_index=None)
                 if scalar:
                     ds_features = set(ds.features_scalar)
@@ -333,7 +360,7 @@ class Pipeline(object):
         if features is None:
             # This means that the pipeline is empty
             features = []
-        labs = [dclab.dfn.get_feature_label(f) for f in features]
+        labs = [get_feature_label(f) for f in features]
         if label_sort:
             lf = sorted(zip(labs, features))
             features = [it[1] for it in lf]
@@ -377,20 +404,50 @@ class Pipeline(object):
         """
         if plot_id is not None:
             dslist = self.get_plot_datasets(plot_id)[0]
+            use_cache = False
         else:
             dslist = self.get_datasets(filt_index=None, apply_filter=False)
+            # The unfiltered per-slot extrema only change when the
+            # slot itself changes (hash), so they can be memoized.
+            use_cache = True
         fmin = np.inf
         fmax = -np.inf
-        for ds in dslist:
+        feat_cache = None
+        for ii, ds in enumerate(dslist):
+            if use_cache:
+                slot = self.slots[ii]
+                cached = self._min_max_cache.get(slot.identifier)
+                if cached is None or cached[0] != slot.hash:
+                    # the slot configuration changed; discard the
+                    # extrema memoized for the previous slot hash
+                    cached = (slot.hash, {})
+                    self._min_max_cache[slot.identifier] = cached
+                feat_cache = cached[1]
+                if feat in feat_cache:
+                    vmin, vmax = feat_cache[feat]
+                    fmin = min(fmin, vmin)
+                    fmax = max(fmax, vmax)
+                    continue
             if np.sum(ds.filter.all):
                 if feat in ds:
                     fdata = ds[feat][ds.filter.all]
-                    invalid = np.logical_or(np.isnan(fdata), np.isinf(fdata))
-                    vdata = fdata[~invalid]
-                    vmin = np.min(vdata)
-                    vmax = np.max(vdata)
-                    fmin = np.min([fmin, vmin])
-                    fmax = np.max([fmax, vmax])
+                    if np.issubdtype(fdata.dtype, np.floating):
+                        # Reduce with a validity mask instead of
+                        # materializing a cleaned copy of the data
+                        # (one pass for the mask, one per reduction).
+                        finite = np.isfinite(fdata)
+                        vmin = float(np.min(fdata, initial=np.inf,
+                                            where=finite))
+                        vmax = float(np.max(fdata, initial=-np.inf,
+                                            where=finite))
+                    else:
+                        # integer features cannot contain nan/inf
+                        vmin = float(np.min(fdata))
+                        vmax = float(np.max(fdata))
+                    if use_cache and np.isfinite(vmin):
+                        feat_cache[feat] = (vmin, vmax)
+                    fmin = min(fmin, vmin)
+                    fmax = max(fmax, vmax)
                 else:
                     warnings.warn("Dataset {} does not ".format(ds.identifier)
                                   + "contain the feature '{}'!".format(feat),
@@ -420,11 +477,13 @@ class Pipeline(object):
         datasets = []
         states = []
         # keep the same order as in self.slots
-        for slot_index in range(len(self.slots)):
-            slot = self.slots[slot_index]
+        # (evaluate `slots_used` once; the property rebuilds its list
+        # on every access)
+        used_slots = set(self.slots_used)
+        for slot_index, slot in enumerate(self.slots):
             slot_id = slot.identifier
             if (self.element_states[slot_id][plot_id]
-                    and slot_id in self.slots_used):
+                    and slot_id in used_slots):
                 ds = self.get_dataset(slot_index=slot_index,
                                       apply_filter=apply_filter)
                 datasets.append(ds)
@@ -489,13 +548,19 @@ class Pipeline(object):
     def get_slot(self, slot_id):
         """Return the Dataslot matching the RTDCBase identifier"""
         slot_id = slot_id.split("-")[0]  # this is how FilterRay names children
-        if slot_id in self.slot_ids:
-            slot = self.slots[self.slot_ids.index(slot_id)]
+        if slot_id in self._slot_index:
+            slot = self.slots[self._slot_index[slot_id]]
         else:
             raise ValueError("Unknown dataset identifier: "
                              + "`{}`".format(slot_id))
         return slot
 
+    def _rebuild_slot_index(self):
+        """Update the slot identifier caches used by `get_slot`/`slot_ids`"""
+        self._slot_ids = [slot.identifier for slot in self.slots]
+        self._slot_index = {
+            slot_id: ii for ii, slot_id in enumerate(self._slot_ids)}
+
     def is_element_active(self, slot_id, filt_plot_id):
         return self.element_states[slot_id][filt_plot_id]
 
@@ -503,24 +568,26 @@ class Pipeline(object):
         """Remove a filter by filter identifier"""
         index = self.filter_ids.index(filt_id)
         self.filters.pop(index)
-        for slot_id in self.element_states:
-            if filt_id in self.element_states[slot_id]:
-                self.element_states[slot_id].pop(filt_id)
+        self._filter_ids.pop(index)
+        for slot_states in self.element_states.values():
+            slot_states.pop(filt_id, None)
 
     def remove_plot(self, plot_id):
         """Remove a filter by plot identifier"""
         index = self.plot_ids.index(plot_id)
         self.plots.pop(index)
-        for slot_id in self.element_states:
-            if plot_id in self.element_states[slot_id]:
-                self.element_states[slot_id].pop(plot_id)
+        self._plot_ids.pop(index)
+        for slot_states in self.element_states.values():
+            slot_states.pop(plot_id, None)
 
     def remove_slot(self, slot_id):
         """Remove a slot by slot identifier"""
-        index = self.slot_ids.index(slot_id)
+        index = self._slot_index[slot_id]
         self.slots.pop(index)
+        self._rebuild_slot_index()
         if slot_id in self.element_states:
             self.element_states.pop(slot_id)
+        self._min_max_cache.pop(slot_id, None)
 
     def reorder_slots(self, indices):
         """Change the order of data slots
@@ -539,6 +606,7 @@ class Pipeline(object):
         for idx in indices:
             new_slots.append(self.slots[idx])
         self.slots = new_slots
+        self._rebuild_slot_index()
 
     def reset(self):
         """Reset the pipeline"""
@@ -552,6 +620,19 @@ class Pipeline(object):
         self.slots = []
         #: individual element states
         self.element_states = {}
+        #: whether a session restore is in progress (see __setstate__)
+        self._batch_restore = False
+        #: cached identifier lists (kept in sync by the mutators so
+        #: that the `*_ids` properties do not allocate on every access)
+        self._filter_ids = []
+        self._plot_ids = []
+        self._slot_ids = []
+        #: cache for `get_min_max` mapping slot identifiers to
+        #: (slot hash, {feat: (min, max)}); entries are replaced when
+        #: the slot hash changes and removed in `remove_slot`
+        self._min_max_cache = {}
+        #: maps slot identifiers to indices in `self.slots`
+        self._slot_index = {}
 
     def set_element_active(self, slot_id, filt_plot_id, active=True):
         """Activate an element in the block matrix"""
@@ -81,19 +81,22 @@ class Dataslot(object):
             calc["emodulus scenario"] = "config"
 
         #: data file format
-        self.format = self.get_dataset().format
+        self.format = ds.format
+
+    def _state(self):
+        """Current state of the slot (not a copy - do not modify)"""
+        return {"color": self.color,
+                "crosstalk": self.config["crosstalk"],
+                "emodulus": self.config["emodulus"],
+                "fl names": self.fl_name_dict,
+                "identifier": self.identifier,
+                "name": self.name,
+                "path": self.path,
+                "slot used": self.slot_used,
+                }
 
     def __getstate__(self):
-        state = {"color": self.color,
-                 "crosstalk": self.config["crosstalk"],
-                 "emodulus": self.config["emodulus"],
-                 "fl names": self.fl_name_dict,
-                 "identifier": self.identifier,
-                 "name": self.name,
-                 "path": self.path,
-                 "slot used": self.slot_used,
-                 }
-        return copy.deepcopy(state)
+        return copy.deepcopy(self._state())
 
     def __repr__(self):
         repre = "<Pipeline Slot '{}' at {}>".format(self.identifier,
@@ -135,7 +138,10 @@ class Dataslot(object):
     @property
     def hash(self):
         """Return the hash of the slot"""
-        return hashobj(self.__getstate__())
+        # `hashobj` only reads the state; skip the deepcopy that
+        # `__getstate__` performs (the hash is checked on every
+        # filter ray access).
+        return hashobj(self._state())
 
     def _set_emodulus_config(self, dataset):
         """Set the Young's modulus data options
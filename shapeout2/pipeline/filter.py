@@ -43,8 +43,9 @@ class Filter(object):
                              + "'{}' already exists!".format(identifier))
         Filter._instances[identifier] = self
 
-    def __getstate__(self):
-        state = {
+    def _state(self):
+        """Current state of the filter (not a copy - do not modify)"""
+        return {
             "filter used": self.filter_used,
             "identifier": self.identifier,
             "limit events bool": self.limit_events[0],
@@ -54,7 +55,9 @@ class Filter(object):
             "box filters": self.boxdict,
             "polygon filters": sorted(self.polylist),
         }
-        return copy.deepcopy(state)
+
+    def __getstate__(self):
+        return copy.deepcopy(self._state())
 
     def __repr__(self):
         repre = "<Pipeline Filter '{}' at {}>".format(self.identifier,
@@ -103,7 +106,23 @@ class Filter(object):
     @property
     def hash(self):
         """Return the hash of the filter"""
-        return hashobj(self.__getstate__())
+        # `hashobj` only reads the state, so the deepcopy that
+        # `__getstate__` performs is not necessary here (this is
+        # evaluated for every filter step on every replot).
+        state = self._state()
+        # The state references polygon filters by identifier only,
+        # but their points can be modified in-place (e.g. when the
+        # user drags a polygon node in QuickView); include the points
+        # so that such changes invalidate the filter ray.
+        points = []
+        for pid in state["polygon filters"]:
+            try:
+                pf = dclab.PolygonFilter.get_instance_from_id(pid)
+            except KeyError:
+                # the polygon filter has been removed
+                continue
+            points.append(pf.points)
+        return hashobj([state, points])
 
     def add_box_filter(self, feature, start, end, active=True):
         """Add a box filter"""
@@ -146,6 +165,14 @@ class Filter(object):
         # remove all previous filters
         dataset.reset_filter()
         cfgfilt = dataset.config["filtering"]
+        # `reset_filter` does not remove box filter limits from the
+        # configuration; strip them explicitly so that the limits of a
+        # previously applied filter do not linger when a filter ray
+        # step is reused (e.g. after removing a filter from the
+        # pipeline).
+        for key in list(cfgfilt.keys()):
+            if key.endswith(" min") or key.endswith(" max"):
+                cfgfilt.pop(key)
 
         # set general options
         cfgfilt.update(self.general)
@@ -23,6 +23,9 @@ class FilterRay(object):
         # used for checking validity of the ray
         self._slot_hash = "unset"
         self._root_child = None
+        # slot/filter hashes of the last `apply_filter` call in
+        # `get_final_child` (skips redundant re-application)
+        self._last_applied = None
 
     def __repr__(self):
         repre = "<Pipeline Filter Ray '{}' at {}>".format(self.identifier,
@@ -60,6 +63,7 @@ class FilterRay(object):
             # reset everything (e.g. emodulus recipe might have changed)
             self.steps = []
             self.step_hashes = []
+            self._last_applied = None
             self._root_child = self._new_child(self.slot.get_dataset(),
                                                apply_filter=True)
             self._slot_hash = self.slot.hash
@@ -131,7 +135,18 @@ class FilterRay(object):
         else:
             final_ds = rtdc_ds
         if apply_filter:
-            final_ds.apply_filter()
+            if external or not filters:
+                final_ds.apply_filter()
+            else:
+                # Skip the re-application if neither the slot nor any
+                # filter in the chain changed since the last call
+                # (the step hashes include in-place changes such as
+                # modified box limits or polygon points).
+                token = (self._slot_hash,
+                         tuple(self.step_hashes[:len(filters)]))
+                if token != self._last_applied:
+                    final_ds.apply_filter()
+                    self._last_applied = token
         return final_ds
 
     def get_dataset(self, filters=None, apply_filter=True):
@@ -23,9 +23,7 @@ def obj2bytes(obj):
         return b"none"
     elif isinstance(obj, np.ndarray):
         return obj.tobytes()
-    elif isinstance(obj, tuple):
-        return obj2bytes(list(obj))
-    elif isinstance(obj, list):
+    elif isinstance(obj, (list, tuple)):
         return b"".join(obj2bytes(o) for o in obj)
     elif isinstance(obj, dict):
         return obj2bytes(sorted(obj.items()))
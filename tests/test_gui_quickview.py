@@ -5,7 +5,9 @@ from PyQt5 import QtCore
 
 import dclab
 import numpy as np
+from scipy.ndimage import binary_erosion
 from shapeout2.gui.main import ShapeOut2
+from shapeout2.gui.quick_view.qv_main import downsample_m4, get_mask_contour
 from shapeout2 import session
 import pytest
 
@@ -267,3 +269,63 @@ def test_update_polygon_filter_issue_26(qtbot):
     assert np.sum(ds2.filter.all) == 8
     # but the plots were not updated in #26
     assert len(qv.widget_scatter.scatter.getData()[0]) == 8
+
+
+def test_downsample_m4_identity():
+    """Small data is passed through unchanged"""
+    x = np.arange(100, dtype=float)
+    y = np.sin(x)
+    # 100 samples fit into 4 * 25 points
+    xd, yd = downsample_m4(x, y, 25)
+    assert xd is x
+    assert yd is y
+    # invalid pixel counts are passed through as well
+    xd, yd = downsample_m4(x, y, 0)
+    assert yd is y
+
+
+def test_downsample_m4_invariants():
+    """Each pixel bin keeps its first, min, max and last sample"""
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 20) + np.cos(x / 3)
+    npix = 30
+    xd, yd = downsample_m4(x, y, npix)
+    size = y.size // npix
+    cut = size * npix
+    for ii in range(npix):
+        ybin = y[ii * size:(ii + 1) * size]
+        ysel = yd[4 * ii:4 * (ii + 1)]
+        # samples stay in their original order within the bin
+        assert ysel[0] == ybin[0]
+        assert ysel[-1] == ybin[-1]
+        assert ysel.min() == ybin.min()
+        assert ysel.max() == ybin.max()
+    # the remainder samples are kept as-is
+    assert np.all(yd[4 * npix:] == y[cut:])
+    # the x axis remains sorted
+    assert np.all(np.diff(xd) >= 0)
+
+
+def test_get_mask_contour_matches_scipy():
+    """Both code paths must match scipy's 4-neighborhood erosion"""
+    rs = np.random.RandomState(42)
+    xx, yy = np.meshgrid(np.arange(80), np.arange(80), indexing="ij")
+    masks = [
+        # a disk
+        (xx - 40) ** 2 + (yy - 38) ** 2 < 30 ** 2,
+        # a mask touching the image border
+        xx < 20,
+        # degenerate cases
+        np.zeros((12, 12), dtype=bool),
+        np.ones((12, 12), dtype=bool),
+    ]
+    # random masks below and above the vectorized code-path threshold
+    for shape in [(5, 6), (7, 9), (30, 17), (64, 80)]:
+        masks.append(rs.rand(*shape) > .4)
+    struct = np.array([[0, 1, 0],
+                       [1, 1, 1],
+                       [0, 1, 0]], dtype=bool)
+    for mask in masks:
+        expected = mask & ~binary_erosion(mask, structure=struct,
+                                          border_value=1)
+        assert np.all(get_mask_contour(mask) == expected)
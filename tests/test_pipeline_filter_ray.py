@@ -65,6 +65,46 @@ def test_get_heredity():
     assert ds5 is ds6  # b/c filt2 does nothing
 
 
+def test_remove_middle_filter_reuses_prefix():
+    path = pathlib.Path(__file__).parent / "data" / "calibration_beads_47.rtdc"
+
+    # initialize
+    slot = pipeline.Dataslot(path)
+    ds = slot.get_dataset()
+    ray = pipeline.FilterRay(slot)
+
+    # three active filters
+    filt1 = pipeline.Filter()
+    filt1.boxdict["area_um"] = {"start": ds["area_um"].min(),
+                                "end": np.mean(ds["area_um"]),
+                                "active": True}
+    filt2 = pipeline.Filter()
+    filt2.boxdict["deform"] = {"start": ds["deform"].min(),
+                               "end": np.mean(ds["deform"]),
+                               "active": True}
+    filt3 = pipeline.Filter()
+    filt3.boxdict["aspect"] = {"start": ds["aspect"].min(),
+                               "end": np.mean(ds["aspect"]),
+                               "active": True}
+
+    # reference: events remaining with only filt1 and filt3
+    ds_ref = ray.get_dataset(filters=[filt1, filt3], apply_filter=True)
+    n_ref = int(np.sum(ds_ref.filter.all))
+
+    ds1 = ray.get_dataset(filters=[filt1, filt2, filt3], apply_filter=True)
+    assert ray._generation == 1  # ray was cut after the first step
+    assert len(ray.steps) == 3
+    assert int(np.sum(ds1.filter.all)) < n_ref
+    first_child = ray.steps[1]
+
+    # removing the middle filter cuts the ray after the first step...
+    ds2 = ray.get_dataset(filters=[filt1, filt3], apply_filter=True)
+    assert ray._generation == 2
+    # ...but the hierarchy children upstream of the cut are reused
+    assert ray.steps[1] is first_child
+    assert int(np.sum(ds2.filter.all)) == n_ref
+
+
 def test_filtering():
     path = pathlib.Path(__file__).parent / "data" / "calibration_beads_47.rtdc"
 
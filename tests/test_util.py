@@ -1,6 +1,14 @@
 from shapeout2 import util
 
 
+def test_hashobj():
+    # tuples and lists hash identically (the filter states mix both)
+    assert util.hashobj((1, "peter", None)) == util.hashobj([1, "peter", None])
+    # dicts are hashed order-independently
+    assert util.hashobj({"a": 1, "b": 2}) == util.hashobj({"b": 2, "a": 1})
+    assert util.hashobj({"a": 1}) != util.hashobj({"a": 2})
+
+
 def test_get_valid_filename():
     assert util.get_valid_filename("KLµ123$)]") == "KLu123?))"
     assert util.get_valid_filename("..KLµ123$)].") == "KLu123?))"